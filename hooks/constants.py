@@ -7,8 +7,8 @@ temporary files when running hooks which breaks imports. Always update both this
 and the inline definitions in the hook files when making changes.
 """
 
-from pathlib import Path
-from typing import List
+import os
+from typing import FrozenSet, List
 
 # Installation tools that should be removed if not needed
 INSTALL_TOOLS: List[str] = [
@@ -22,45 +22,23 @@ INSTALL_TOOLS: List[str] = [
 ]
 
 
-# Directories to check for cleanup after selective file generation
-CLEANUP_DIRECTORIES: List[str] = [
-    "docs",
-    "ai_conventions/providers",
-    "ai_conventions",
-    ".cursor/rules",
-    ".cursor",
-    ".windsurf/rules",
-    ".windsurf",
-    ".github/prompts",
-    ".github",
-    ".vscode",
-    ".codex",
-    ".claude/commands",
-    ".claude",
-    "templates/claude",
-    "templates/cursor/rules",
-    "templates/cursor",
-    "templates/windsurf/rules",
-    "templates/windsurf",
-    "templates/aider",
-    "templates/copilot/prompts",
-    "templates/copilot",
-    "templates/codex",
-    "templates",
-]
+# Rendered boolean spellings that count as enabled
+TRUTHY_VALUES: FrozenSet[str] = frozenset(("true", "yes", "1", "y"))
 
 
 # Default domains when none are selected
 DEFAULT_DOMAINS: List[str] = ["git", "testing"]
 
 
-# Possible locations for domain registry
-REGISTRY_LOCATIONS: List[Path] = [
-    Path.cwd() / "community-domains" / "registry.yaml",
-    Path(__file__).parent.parent / "community-domains" / "registry.yaml",
-    Path.home()
-    / ".cookiecutters"
-    / "cookiecutter-ai-conventions"
-    / "community-domains"
-    / "registry.yaml",
+# Possible locations for domain registry (plain strings, each opened directly)
+REGISTRY_LOCATIONS: List[str] = [
+    os.path.join(os.getcwd(), "community-domains", "registry.json"),
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "community-domains", "registry.json"),
+    os.path.join(
+        os.path.expanduser("~"),
+        ".cookiecutters",
+        "cookiecutter-ai-conventions",
+        "community-domains",
+        "registry.json",
+    ),
 ]
@@ -8,8 +8,9 @@ and the inline definitions in the hook files when making changes.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -24,14 +25,17 @@ class ProviderFiles:
     domain_specific_patterns: List[str] = field(default_factory=list)
     conditional_files: dict = field(default_factory=dict)  # Files that depend on features
 
-    def all_paths(self) -> List[Path]:
+    @cached_property
+    def removable_paths(self) -> Tuple[Path, ...]:
+        """Config files, template dirs and docs - everything but the Python module."""
+        return tuple(Path(f) for f in [*self.config_files, *self.template_dirs, *self.docs])
+
+    @cached_property
+    def all_paths(self) -> Tuple[Path, ...]:
         """Get all file paths for this provider."""
-        paths: List[Path] = []
-        for file_list in [self.config_files, self.template_dirs, self.docs]:
-            paths.extend(Path(f) for f in file_list)
         if self.module:
-            paths.append(Path(self.module))
-        return paths
+            return (*self.removable_paths, Path(self.module))
+        return self.removable_paths
 
 
 # Define all provider file mappings
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Post-generation hook for cookiecutter-ai-conventions."""
 
+import json
 import os
+import re
 import shutil
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
-
-import yaml
+from typing import List, Optional, Tuple
 
 # Data models and constants defined inline for cookiecutter compatibility
 # (cookiecutter creates temporary files which breaks imports)
@@ -25,14 +26,17 @@ class ProviderFiles:
     domain_specific_patterns: List[str] = field(default_factory=list)
     conditional_files: dict = field(default_factory=dict)  # Files that depend on features
 
-    def all_paths(self) -> List[Path]:
+    @cached_property
+    def removable_paths(self) -> Tuple[Path, ...]:
+        """Config files, template dirs and docs - everything but the Python module."""
+        return tuple(Path(f) for f in [*self.config_files, *self.template_dirs, *self.docs])
+
+    @cached_property
+    def all_paths(self) -> Tuple[Path, ...]:
         """Get all file paths for this provider."""
-        paths: List[Path] = []
-        for file_list in [self.config_files, self.template_dirs, self.docs]:
-            paths.extend(Path(f) for f in file_list)
         if self.module:
-            paths.append(Path(self.module))
-        return paths
+            return (*self.removable_paths, Path(self.module))
+        return self.removable_paths
 
 
 # Define all provider file mappings
@@ -100,44 +104,109 @@ INSTALL_TOOLS = [
     ".python-version",
 ]
 
-# Directories to check for cleanup after selective file generation
-CLEANUP_DIRECTORIES = [
-    "docs",
-    "ai_conventions/providers",
-    "ai_conventions",
-    ".cursor/rules",
-    ".cursor",
-    ".windsurf/rules",
-    ".windsurf",
-    ".github/prompts",
-    ".github",
-    ".vscode",
-    ".codex",
-    ".claude/commands",
-    ".claude",
-    "templates/claude",
-    "templates/cursor/rules",
-    "templates/cursor",
-    "templates/windsurf/rules",
-    "templates/windsurf",
-    "templates/aider",
-    "templates/copilot/prompts",
-    "templates/copilot",
-    "templates/codex",
-    "templates",
-]
+# Rendered boolean spellings that count as enabled
+TRUTHY_VALUES = frozenset(("true", "yes", "1", "y"))
+
+# First H1 line of the generated README, plus the blank line after it if present
+README_TITLE = re.compile(r"^# [^\r\n]+\r?\n(?:\r?\n)?", re.MULTILINE)
+
+# Template values, rendered into literals once when cookiecutter runs this hook
+COOKIECUTTER_CONTEXT = {
+    "project_name": "{{ cookiecutter.project_name }}",
+    "project_slug": "{{ cookiecutter.project_slug }}",
+    "author_name": "{{ cookiecutter.author_name }}",
+    "author_email": "{{ cookiecutter.author_email }}",
+    # List-like options are rendered as JSON (padded so a leading or trailing quote
+    # can't merge with the delimiters), so a string or a list both decode cleanly
+    "selected_providers": r""" {{ cookiecutter.selected_providers | jsonify }} """,
+    "default_domains": r""" {{ cookiecutter.default_domains | jsonify }} """,
+    "enable_learning_capture": "{{ cookiecutter.enable_learning_capture }}",
+    "enable_context_canary": "{{ cookiecutter.enable_context_canary }}",
+    "enable_domain_composition": "{{ cookiecutter.enable_domain_composition }}",
+    "include_install_tools": "{{ cookiecutter.include_install_tools }}",
+}
+
+
+def is_truthy(value):
+    """Interpret a rendered cookiecutter boolean ("True", "yes", "1", ...)."""
+    return value.lower() in TRUTHY_VALUES
+
+
+def parse_list_option(rendered):
+    """Decode a jsonify-rendered option into a list of non-empty names.
+
+    Lists pass through; strings may be comma-separated or hold a JSON list.
+    """
+    value = json.loads(rendered)
+    if isinstance(value, str):
+        if value.startswith("["):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                # Bracketed but not JSON, e.g. "[git, testing]" typed at the prompt
+                value = [item.strip().strip("'\"") for item in value.strip("[]").split(",")]
+        else:
+            value = value.split(",")
+    if not isinstance(value, list):
+        value = [value]
+    ignored = [item for item in value if not isinstance(item, str)]
+    if ignored:
+        print(f"  Warning: Ignoring non-text list entries: {ignored}")
+    return [item.strip() for item in value if isinstance(item, str) and item.strip()]
+
+
+def list_project_root():
+    """Map the names of the top-level entries in the project to their DirEntry, from one scan."""
+    with os.scandir(".") as entries:
+        return {entry.name: entry for entry in entries}
+
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead if linking fails (existing dst, other device)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # copy() keeps file modes but skips copy2's timestamp/xattr syscalls
+        shutil.copy(src, dst)
+    return dst
 
 
 def copy_domain(domain, source_dir, target_dir):
-    """Copy a domain directory from source to target."""
+    """Move a domain directory from source to target, copying if it can't be renamed."""
     source = source_dir / domain
     target = target_dir / domain
 
-    if source.exists():
-        print(f"  Adding domain: {domain}")
-        shutil.copytree(source, target, dirs_exist_ok=True)
-    else:
-        print(f"  Warning: Domain '{domain}' not found in community domains")
+    try:
+        # The source tree is deleted afterwards, so a rename avoids copying it
+        os.rename(source, target)
+    except OSError:
+        # Target already exists (template-provided domain) or is on another device
+        try:
+            shutil.copytree(source, target, dirs_exist_ok=True, copy_function=link_or_copy)
+        except FileNotFoundError:
+            print(f"  Warning: Domain '{domain}' not found in community domains")
+            return
+
+    print(f"  Adding domain: {domain}")
+
+
+def render_config_yaml(config):
+    """Render the flat config mapping as YAML, quoting scalars as JSON (valid YAML).
+
+    Non-ASCII text is written as-is: YAML reads JSON surrogate-pair escapes back
+    as two lone surrogates rather than one character.
+    """
+    lines = []
+    for key, value in config.items():
+        if isinstance(value, list):
+            if value:
+                lines.append(f"{key}:")
+                lines.extend(f"- {json.dumps(item, ensure_ascii=False)}" for item in value)
+            else:
+                lines.append(f"{key}: []")
+        else:
+            lines.append(f"{key}: {json.dumps(value, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n"
 
 
 def create_config_file(providers, domains, config_data):
@@ -156,8 +225,7 @@ def create_config_file(providers, domains, config_data):
 
     # Save as .ai-conventions.yaml
     config_path = Path(".ai-conventions.yaml")
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    config_path.write_text(render_config_yaml(config), encoding="utf-8")
 
     print(f"  Created configuration file: {config_path}")
     return config_path
@@ -166,136 +234,128 @@ def create_config_file(providers, domains, config_data):
 def update_readme(providers, domains, include_tools):
     """Update README to reflect what was actually included."""
     readme_path = Path("README.md")
-    if not readme_path.exists():
+    try:
+        # newline="" keeps CRLF line endings so the section can match them
+        with open(readme_path, encoding="utf-8", newline="") as f:
+            content = f.read()
+    except FileNotFoundError:
         return
 
-    content = readme_path.read_text()
-
     # Add section about what's included
-    included_section = "\n## 📦 What's Included\n\n"
+    parts = ["## 📦 What's Included\n\n"]
 
     if providers:
-        included_section += "### AI Providers\n"
-        for provider in providers:
-            included_section += f"- {provider.capitalize()}\n"
-        included_section += "\n"
+        parts.append("### AI Providers\n")
+        parts.extend(f"- {provider.capitalize()}\n" for provider in providers)
+        parts.append("\n")
 
     if domains:
-        included_section += "### Convention Domains\n"
-        for domain in domains:
-            included_section += f"- {domain.capitalize()}\n"
-        included_section += "\n"
+        parts.append("### Convention Domains\n")
+        parts.extend(f"- {domain.capitalize()}\n" for domain in domains)
+        parts.append("\n")
 
     if include_tools:
-        included_section += "### Installation Tools\n"
-        included_section += "- Python module for automated installation\n"
-        included_section += "- Textual TUI for provider management\n"
-        included_section += "\n"
-
-    # Insert after the first heading
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if line.startswith("# ") and i > 0:
-            lines.insert(i + 2, included_section)
-            break
-
-    readme_path.write_text("\n".join(lines))
+        parts.append(
+            "### Installation Tools\n"
+            "- Python module for automated installation\n"
+            "- Textual TUI for provider management\n"
+            "\n"
+        )
+
+    included_section = "".join(parts)
+
+    # Insert after the title heading and the blank line that follows it
+    match = README_TITLE.search(content)
+    if not match:
+        print("  Warning: README.md has no title heading, skipped the included components")
+        return
+    if "\r\n" in match.group():
+        included_section = included_section.replace("\n", "\r\n")
+
+    with open(readme_path, "w", encoding="utf-8", newline="") as f:
+        f.write(content[: match.end()] + included_section + content[match.end() :])
     print("  Updated README.md with included components")
 
 
-def remove_unselected_providers(selected_providers, enable_learning_capture=True):
+def remove_paths(paths, present):
+    """Remove each existing file or directory tree and return how many were removed."""
+    removed_count = 0
+    for path in paths:
+        # Skip paths under a missing top-level entry without stat'ing them
+        entry = present.get(path.parts[0])
+        if entry is None:
+            continue
+        try:
+            # Top-level paths reuse the file type cached by the scan
+            if entry.is_dir() if len(path.parts) == 1 else path.is_dir():
+                shutil.rmtree(path)
+                print(f"    ✗ Removed directory: {path}")
+            else:
+                os.unlink(path)
+                print(f"    ✗ Removed file: {path}")
+            removed_count += 1
+        except FileNotFoundError:
+            pass
+        except (OSError, PermissionError) as e:
+            print(f"    Warning: Could not remove {path}: {e}")
+    return removed_count
+
+
+def remove_unselected_rule_files(rules_dir, suffix, keep):
+    """Delete per-domain rule files whose name (minus suffix) is not in keep."""
+    try:
+        with os.scandir(rules_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.name[: -len(suffix)] not in keep:
+                    os.unlink(entry.path)
+                    print(f"  Removed unselected domain file: {entry.name}")
+    except FileNotFoundError:
+        pass
+
+
+def remove_unselected_providers(selected_providers, enable_learning_capture=True, present=None):
     """Remove config files and docs for unselected providers, but keep all Python modules."""
     removed_count = 0
+    if present is None:
+        present = list_project_root()
 
     for provider_name, provider_files in PROVIDER_REGISTRY.items():
         if provider_name not in selected_providers:
             print(f"\n  Removing {provider_name} config files...")
-
             # Remove only config files, templates, and docs - NOT Python modules
-            paths_to_remove = []
-
-            # Add config files and template dirs
-            for file_list in [
-                provider_files.config_files,
-                provider_files.template_dirs,
-                provider_files.docs,
-            ]:
-                paths_to_remove.extend(Path(f) for f in file_list)
-
-            # Note: We explicitly do NOT remove provider_files.module (the Python file)
-
-            for path in paths_to_remove:
-                if path.exists():
-                    try:
-                        if path.is_dir():
-                            shutil.rmtree(path)
-                            print(f"    ✗ Removed directory: {path}")
-                        else:
-                            path.unlink()
-                            print(f"    ✗ Removed file: {path}")
-                        removed_count += 1
-                    except (OSError, PermissionError) as e:
-                        print(f"    Warning: Could not remove {path}: {e}")
+            removed_count += remove_paths(provider_files.removable_paths, present)
 
     # Note: Learning capture is now always enabled - no conditional removal
 
     return removed_count
 
 
-def remove_install_tools():
+def remove_install_tools(present=None):
     """Remove Python installation tools if not wanted."""
-    tools_to_remove = INSTALL_TOOLS
-
-    removed_count = 0
+    if present is None:
+        present = list_project_root()
     print("\n  Removing installation tools...")
-
-    for tool in tools_to_remove:
-        path = Path(tool)
-        if path.exists():
-            try:
-                if path.is_dir():
-                    shutil.rmtree(path)
-                    print(f"    ✗ Removed directory: {tool}")
-                else:
-                    path.unlink()
-                    print(f"    ✗ Removed file: {tool}")
-                removed_count += 1
-            except (OSError, PermissionError) as e:
-                print(f"    Warning: Could not remove {tool}: {e}")
-
-    return removed_count
+    return remove_paths([Path(tool) for tool in INSTALL_TOOLS], present)
 
 
 def main():
     """Process the generated project."""
+    context = COOKIECUTTER_CONTEXT
+
     # Get selected domains
-    selected_domains = "{{ cookiecutter.default_domains }}"
+    selected_domains = parse_list_option(context["default_domains"])
 
     # Check if learning capture is enabled
-    enable_learning_str = "{{ cookiecutter.enable_learning_capture }}"
-    enable_learning = enable_learning_str.lower() in ["true", "yes", "1", "y"]
+    enable_learning = is_truthy(context["enable_learning_capture"])
 
     # Check if domain composition is enabled
-    enable_composition_str = "{{ cookiecutter.enable_domain_composition }}"
-    enable_composition = enable_composition_str.lower() in ["true", "yes", "1", "y"]
+    enable_composition = is_truthy(context["enable_domain_composition"])
 
     # Check if install tools should be included
-    include_tools_str = "{{ cookiecutter.include_install_tools }}"
-    include_tools = include_tools_str.lower() in ["true", "yes", "1", "y"]
+    include_tools = is_truthy(context["include_install_tools"])
 
     # Get providers
-    providers = "{{ cookiecutter.selected_providers }}"
-
-    # Ensure providers is a list
-    if isinstance(providers, str):
-        # Handle comma-separated providers
-        if "," in providers:
-            providers = [p.strip() for p in providers.split(",")]
-        else:
-            providers = [providers]
-
-    # Filter out empty strings
-    providers = [p for p in providers if p]
+    providers = parse_list_option(context["selected_providers"])
 
     # Validate providers
     if not providers or len(providers) == 0:
@@ -304,33 +364,22 @@ def main():
         print("   Consider re-running with at least one provider selected.")
         providers = []  # Ensure it's an empty list for consistency
 
-    # Ensure selected_domains is a list
-    if isinstance(selected_domains, str):
-        # If it's a JSON string, parse it
-        import json
-
-        try:
-            selected_domains = json.loads(selected_domains)
-        except json.JSONDecodeError:
-            # If it's not JSON, try comma-separated
-            if "," in selected_domains:
-                selected_domains = [d.strip() for d in selected_domains.split(",")]
-            else:
-                selected_domains = [selected_domains]
+    # Membership checks below use the set; the list keeps the user's order for output
+    provider_set = frozenset(providers)
 
-    # Set up paths
-    project_root = Path.cwd()
-    domains_dir = project_root / "domains"
-    community_domains = project_root / "community-domains"
-
-    # Create domains directory
-    domains_dir.mkdir(exist_ok=True)
+    # Set up paths (cookiecutter runs this hook from the project root)
+    domains_dir = Path("domains")
+    community_domains = Path("community-domains")
+    # No mkdir: the template ships domains/, and copytree creates missing parents
 
     # Validate selected domains exist
     if selected_domains:
         available_domains = []
-        if community_domains.exists():
-            available_domains = [d.name for d in community_domains.iterdir() if d.is_dir()]
+        try:
+            with os.scandir(community_domains) as entries:
+                available_domains = [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            pass
 
         invalid_domains = [d for d in selected_domains if d not in available_domains]
         if invalid_domains:
@@ -344,21 +393,19 @@ def main():
     for domain in selected_domains:
         copy_domain(domain, community_domains, domains_dir)
 
-    # Clean up community-domains directory
-    if community_domains.exists():
-        shutil.rmtree(community_domains)
+    # Clean up community-domains directory (only unselected domains are left in it)
+    shutil.rmtree(community_domains, ignore_errors=True)
 
     # Parse context canary setting
-    enable_canary_str = "{{ cookiecutter.enable_context_canary }}"
-    enable_canary = enable_canary_str.lower() in ["true", "yes", "1", "y"]
+    enable_canary = is_truthy(context["enable_context_canary"])
 
     # Create configuration file early so it's available for tools
     print("\nCreating configuration file...")
     config_data = {
-        "project_name": "{{ cookiecutter.project_name }}",
-        "project_slug": "{{ cookiecutter.project_slug }}",
-        "author_name": "{{ cookiecutter.author_name }}",
-        "author_email": "{{ cookiecutter.author_email }}",
+        "project_name": context["project_name"],
+        "project_slug": context["project_slug"],
+        "author_name": context["author_name"],
+        "author_email": context["author_email"],
         "enable_learning_capture": enable_learning,
         "enable_context_canary": enable_canary,
         "enable_domain_composition": enable_composition,
@@ -368,11 +415,14 @@ def main():
 
     # Remove unselected providers using our comprehensive approach
     print("\nCleaning up unselected providers...")
-    remove_unselected_providers(providers, enable_learning)
+    # One root listing serves both passes; entries removed in between just raise
+    # FileNotFoundError, which remove_paths already skips
+    present = list_project_root()
+    remove_unselected_providers(provider_set, enable_learning, present)
 
     # Remove installation tools if not wanted
     if not include_tools:
-        remove_install_tools()
+        remove_install_tools(present)
 
     # Update README with what's included
     print("\nUpdating README...")
@@ -380,64 +430,57 @@ def main():
 
     # Handle special cases for selected providers
 
+    keep_rules = frozenset(("main", *selected_domains))
+
     # Cursor: Clean up domain-specific MDC files not in selected domains
-    if providers and "cursor" in providers:
-        cursor_rules_dir = Path(".cursor/rules")
-        if cursor_rules_dir.exists():
-            for mdc_file in cursor_rules_dir.glob("*.mdc"):
-                if mdc_file.stem not in ["main"] + selected_domains:
-                    mdc_file.unlink()
-                    print(f"  Removed unselected domain file: {mdc_file.name}")
+    if "cursor" in provider_set:
+        remove_unselected_rule_files(".cursor/rules", ".mdc", keep_rules)
 
     # Windsurf: Clean up domain-specific rule files not in selected domains
-    if providers and "windsurf" in providers:
-        windsurf_rules_dir = Path(".windsurf/rules")
-        if windsurf_rules_dir.exists():
-            for rule_file in windsurf_rules_dir.glob("*.md"):
-                if rule_file.stem not in ["main"] + selected_domains:
-                    rule_file.unlink()
-                    print(f"  Removed unselected domain file: {rule_file.name}")
+    if "windsurf" in provider_set:
+        remove_unselected_rule_files(".windsurf/rules", ".md", keep_rules)
 
     # Copilot: Special handling for vscode_config rename
-    if providers and "copilot" in providers:
-        vscode_config = Path("vscode_config")
-        if vscode_config.exists():
-            vscode_config.rename(".vscode")
+    if "copilot" in provider_set:
+        try:
+            os.rename("vscode_config", ".vscode")
             print("  Renamed vscode_config to .vscode for Copilot")
+        except FileNotFoundError:
+            pass
 
     # Codex: Make script executable (Unix-like systems only)
-    if providers and "codex" in providers:
-        codex_script = Path("codex.sh")
-        if codex_script.exists() and os.name != "nt":  # Skip chmod on Windows
-            try:
-                codex_script.chmod(codex_script.stat().st_mode | 0o111)
-                print("  Made codex.sh executable")
-            except (OSError, AttributeError):
-                print("  Warning: Could not make codex.sh executable")
+    if "codex" in provider_set and os.name != "nt":  # Skip chmod on Windows
+        try:
+            # Freshly generated, so set rwxr-xr-x outright rather than stat'ing first
+            os.chmod("codex.sh", 0o755)
+            print("  Made codex.sh executable")
+        except FileNotFoundError:
+            pass
+        except OSError:
+            print("  Warning: Could not make codex.sh executable")
 
     # Learning capture is now always enabled for all users
     # Remove legacy Python scripts since we have CLI commands now
-    commands_dir = Path("commands")
-    if commands_dir.exists():
-        # Remove .py files but keep .md files
-        for py_file in commands_dir.glob("*.py"):
-            py_file.unlink()
-
-    # Clean up Claude commands if not using Claude
-    if providers and "claude" not in providers:
-        claude_commands_dir = Path(".claude/commands")
-        if claude_commands_dir.exists():
-            shutil.rmtree(Path(".claude"))
-
-    # Provider modules are already handled by remove_unselected_providers()
+    try:
+        with os.scandir("commands") as entries:
+            # Remove .py files but keep .md files
+            for entry in entries:
+                if entry.name.endswith(".py"):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
+
+    # .claude/ (commands included) and the other providers' config trees are already
+    # gone via remove_unselected_providers(); provider modules are kept
 
     # Handle domain composition
     if not enable_composition:
         # Remove domain resolver module
-        resolver_path = Path("ai_conventions/domain_resolver.py")
-        if resolver_path.exists():
-            resolver_path.unlink()
+        try:
+            os.remove("ai_conventions/domain_resolver.py")
             print("  - Removed domain resolver (composition not enabled)")
+        except FileNotFoundError:
+            pass
 
     print("\n[OK] Project setup complete!")
 
@@ -445,35 +488,35 @@ def main():
     if providers:
         print(f"\nConfigured for: {', '.join(providers)}")
 
-        if "claude" in providers:
+        if "claude" in provider_set:
             print("\nClaude setup:")
             print("  Your conventions will be automatically loaded via CLAUDE.md")
             if enable_learning:
                 print("  Capture learnings with: ai-conventions capture")
                 print("  Review learnings with: ai-conventions review")
 
-        if "cursor" in providers:
+        if "cursor" in provider_set:
             print("\nCursor setup:")
             print("  Your conventions are configured in:")
             print("  - .cursorrules (legacy format)")
             print("  - .cursor/rules/ (modern MDC format)")
             print("  Cursor will automatically load these rules!")
 
-        if "windsurf" in providers:
+        if "windsurf" in provider_set:
             print("\nWindsurf setup:")
             print("  Your conventions are configured in:")
             print("  - .windsurfrules (main rules file)")
             print("  - .windsurf/rules/ (advanced rules with globs)")
             print("  Windsurf will automatically load these rules!")
 
-        if "aider" in providers:
+        if "aider" in provider_set:
             print("\nAider setup:")
             print("  Your conventions are configured in:")
             print("  - CONVENTIONS.md (automatically loaded)")
             print("  - .aider.conf.yml (configuration)")
             print("  Just run 'aider' to start coding!")
 
-        if "copilot" in providers:
+        if "copilot" in provider_set:
             print("\nGitHub Copilot setup:")
             print("  Your conventions are configured in:")
             print("  - .github/copilot-instructions.md (automatically loaded)")
@@ -481,7 +524,7 @@ def main():
             print("  - .github/prompts/ (domain-specific prompts)")
             print("  Copilot will automatically use your conventions!")
 
-        if "codex" in providers:
+        if "codex" in provider_set:
             print("\nOpenAI Codex setup:")
             print("  Your conventions are configured in:")
             print("  - AGENTS.md (automatically loaded)")
@@ -508,20 +551,18 @@ def main():
 
 def cleanup_empty_directories():
     """Remove any empty directories left after selective file generation."""
-    dirs_to_check = CLEANUP_DIRECTORIES
-
-    # Check directories from deepest to shallowest
-    for dir_path in dirs_to_check:
-        path = Path(dir_path)
-        if path.exists() and path.is_dir():
-            try:
-                # Check if directory is empty
-                if not any(path.iterdir()):
-                    path.rmdir()
-                    print(f"  - Removed empty directory: {dir_path}")
-            except OSError:
-                # Directory not empty or permission issue
-                pass
+    removed = set()
+    # Bottom-up, so a directory whose children were all just removed goes too
+    for root, dirs, files in os.walk(".", topdown=False):
+        if root == "." or files or any(os.path.join(root, d) not in removed for d in dirs):
+            continue
+        try:
+            os.rmdir(root)
+        except OSError:
+            # Permission issue
+            continue
+        removed.add(root)
+        print(f"  - Removed empty directory: {root[2:]}")
 
 
 if __name__ == "__main__":
@@ -9,81 +9,104 @@ from pathlib import Path
 # (cookiecutter creates temporary files which breaks imports)
 DEFAULT_DOMAINS = ["git", "testing"]
 REGISTRY_LOCATIONS = [
-    Path.cwd() / "community-domains" / "registry.yaml",
-    Path(__file__).parent.parent / "community-domains" / "registry.yaml",
-    Path.home()
-    / ".cookiecutters"
-    / "cookiecutter-ai-conventions"
-    / "community-domains"
-    / "registry.yaml",
+    os.path.join(os.getcwd(), "community-domains", "registry.json"),
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "community-domains", "registry.json"),
+    os.path.join(
+        os.path.expanduser("~"),
+        ".cookiecutters",
+        "cookiecutter-ai-conventions",
+        "community-domains",
+        "registry.json",
+    ),
 ]
 
 
 def load_domain_registry():
     """Load available domains from registry."""
-    # Try multiple locations for the registry
-    possible_locations = REGISTRY_LOCATIONS
-
-    for registry_path in possible_locations:
-        if registry_path.exists():
-            try:
-                import yaml
-
-                with open(registry_path) as f:
-                    return yaml.safe_load(f)
-            except ImportError:
-                print("Warning: PyYAML not available, using defaults")
-                return None
-            except Exception as e:
-                print(f"Warning: Could not load registry: {e}")
-                return None
+    # Only interactive runs read the registry, so keep json off the default path
+    import json
+
+    # An explicit registry path skips the search; otherwise try each location,
+    # opening it directly
+    override = os.environ.get("COOKIECUTTER_REGISTRY_PATH")
+    for registry_path in [override] if override else REGISTRY_LOCATIONS:
+        try:
+            data = Path(registry_path).read_bytes()
+        except OSError as e:
+            if override:
+                print(f"Warning: Could not read registry {registry_path}: {e}")
+            continue
+
+        try:
+            registry = json.loads(data)
+            # registry.json lists domains; index them by name for selection
+            domains = registry.get("domains", [])
+            if isinstance(domains, list):
+                registry["domains"] = {d["name"]: d for d in domains}
+            elif not isinstance(domains, dict):
+                raise ValueError("'domains' must be a list or mapping of domain entries")
+        except Exception as e:
+            print(f"Warning: Could not load registry: {e}")
+            return None
+
+        return registry
 
     return None
 
 
-def interactive_domain_selection():
-    """Interactive TUI for domain selection."""
+def load_rich():
+    """Import the Rich pieces used for selection, or return None if Rich is missing."""
     try:
         from rich.console import Console
-        from rich.prompt import Confirm
+        from rich.prompt import Prompt
         from rich.table import Table
+    except ImportError:
+        return None
+    return Console, Prompt, Table
 
-        console = Console()
-
-        # Load registry
-        registry = load_domain_registry()
-        if not registry:
-            console.print("[yellow]Warning: Could not load domain registry[/yellow]")
-            return ["git", "testing"]
-
-        # Display available domains
-        table = Table(title="Available Convention Domains")
-        table.add_column("Domain", style="cyan")
-        table.add_column("Description", style="white")
-        table.add_column("Author", style="green")
 
-        domains = registry.get("domains", {})
-        for domain_id, info in domains.items():
-            table.add_row(domain_id, info.get("description", ""), info.get("author", "Community"))
+def interactive_domain_selection():
+    """Interactive TUI for domain selection."""
+    rich = load_rich()
+    if rich is None:
+        print("Rich not available, using simple selection")
+        return simple_domain_selection()
+    Console, Prompt, Table = rich
 
-        console.print(table)
-        console.print("\n[bold]Select domains to include:[/bold]")
+    console = Console()
 
-        # Get selections
-        selected = []
-        for domain_id, _info in domains.items():
-            if Confirm.ask(f"Include [cyan]{domain_id}[/cyan]?", default=True):
-                selected.append(domain_id)
+    # Load registry
+    registry = load_domain_registry()
+    if not registry:
+        console.print("[yellow]Warning: Could not load domain registry[/yellow]")
+        return ["git", "testing"]
 
-        if not selected:
-            console.print("[yellow]No domains selected, using defaults[/yellow]")
-            return DEFAULT_DOMAINS
+    # Display available domains
+    table = Table(title="Available Convention Domains")
+    table.add_column("Domain", style="cyan")
+    table.add_column("Description", style="white")
+    table.add_column("Author", style="green")
 
-        return selected
+    domains = registry.get("domains", {})
+    for domain_id, info in domains.items():
+        table.add_row(domain_id, info.get("description", ""), info.get("author", "Community"))
+
+    console.print(table)
+    console.print("\n[bold]Select domains to include:[/bold]")
+
+    # Get all selections from a single prompt rather than one per domain
+    answer = Prompt.ask("Domains to include (comma-separated)", default=",".join(domains))
+    names = [d.strip() for d in answer.split(",") if d.strip()]
+    unknown = [d for d in names if d not in domains]
+    if unknown:
+        console.print(f"[yellow]Ignoring unknown domains: {', '.join(unknown)}[/yellow]")
+    selected = [d for d in names if d in domains]
+
+    if not selected:
+        console.print("[yellow]No domains selected, using defaults[/yellow]")
+        return DEFAULT_DOMAINS
 
-    except ImportError:
-        print("Rich not available, using simple selection")
-        return simple_domain_selection()
+    return selected
 
 
 def simple_domain_selection():
@@ -112,13 +135,12 @@ def simple_domain_selection():
         return [d[0] for d in domain_list]
 
     # Parse selection
-    selected = []
+    count = len(domain_list)
     try:
-        indices = [int(x.strip()) - 1 for x in selection.split(",")]
-        for idx in indices:
-            if 0 <= idx < len(domain_list):
-                selected.append(domain_list[idx][0])
-    except (ValueError, IndexError):
+        selected = [
+            domain_list[i - 1][0] for i in map(int, selection.split(",")) if 1 <= i <= count
+        ]
+    except ValueError:
         print("Invalid selection, using defaults")
         return DEFAULT_DOMAINS
 
@@ -1,6 +1,10 @@
 """Shared test configuration and fixtures for UV tool testing."""
 
+import shutil
 import subprocess
+import sys
+import time
+from pathlib import Path
 from typing import List, Optional
 
 import pytest
@@ -42,12 +46,23 @@ def uv_tool_cleanup():
 
         def cleanup_all(self):
             """Clean up all tracked tools."""
-            for tool_name in installed_tools:
-                subprocess.run(
-                    ["uv", "tool", "uninstall", tool_name],
-                    capture_output=True,
-                    check=False,
-                )
+            if not installed_tools:
+                return
+
+            # uv accepts several names at once; fall back to one call per
+            # tool if the batch fails (e.g. one of them was never installed)
+            result = subprocess.run(
+                ["uv", "tool", "uninstall", *installed_tools],
+                capture_output=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                for tool_name in installed_tools:
+                    subprocess.run(
+                        ["uv", "tool", "uninstall", tool_name],
+                        capture_output=True,
+                        check=False,
+                    )
             installed_tools.clear()
 
     cleanup = UVToolCleanup()
@@ -58,9 +73,12 @@ def uv_tool_cleanup():
     cleanup.cleanup_all()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uv_available():
     """Skip test if UV is not available in the environment."""
+    # The probe result (including the skip) is cached for the whole session
+    if shutil.which("uv") is None:
+        pytest.skip("UV not available in test environment")
     try:
         result = subprocess.run(
             ["uv", "--version"],
@@ -74,9 +92,11 @@ def uv_available():
         pytest.skip("UV not available or not responding")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def git_available():
     """Skip test if git is not available in the environment."""
+    if shutil.which("git") is None:
+        pytest.skip("Git not available in test environment")
     try:
         result = subprocess.run(
             ["git", "--version"],
@@ -94,7 +114,6 @@ def git_available():
 @pytest.fixture
 def performance_monitor():
     """Monitor test performance to ensure UV operations stay within limits."""
-    import time
 
     class PerformanceMonitor:
         def __init__(self):
@@ -107,14 +126,14 @@ def performance_monitor():
 
         def start(self):
             """Start timing an operation."""
-            self.start_time = time.time()
+            self.start_time = time.perf_counter_ns()
 
         def check(self, operation: str, custom_threshold: Optional[float] = None):
             """Check if operation completed within threshold."""
             if self.start_time is None:
                 raise ValueError("Must call start() before check()")
 
-            duration = time.time() - self.start_time
+            duration = (time.perf_counter_ns() - self.start_time) / 1e9
             threshold = custom_threshold or self.thresholds.get(operation, 60)
 
             if duration > threshold:
@@ -124,3 +143,89 @@ def performance_monitor():
             return duration
 
     return PerformanceMonitor()
+
+
+# Session-wide bakes for tests that share the same template context.
+# Tests that write into the project should copy it first (see copy_project).
+def _bake_once(cookies_session, extra_context):
+    result = cookies_session.bake(extra_context=extra_context)
+    assert result.exit_code == 0
+    assert result.exception is None
+    return result.project_path
+
+
+@pytest.fixture(scope="session")
+def baked_claude_canary(cookies_session):
+    """Claude project with the context canary enabled."""
+    return _bake_once(
+        cookies_session,
+        {
+            "project_slug": "my-project",
+            "enable_context_canary": True,
+            "selected_providers": "claude",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def baked_capture_project(cookies_session):
+    """Project with learning capture enabled."""
+    return _bake_once(
+        cookies_session, {"project_slug": "test-capture", "enable_learning_capture": True}
+    )
+
+
+@pytest.fixture(scope="session")
+def baked_claude_project(cookies_session):
+    """Claude-only project with learning capture and the default domains."""
+    return _bake_once(
+        cookies_session,
+        {
+            "project_name": "Test AI Conventions",
+            "project_slug": "test-ai-conventions",
+            "author_name": "Test Author",
+            "default_domains": "git,testing",
+            "enable_learning_capture": True,
+            "selected_providers": "claude",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def ai_conventions_path(baked_claude_canary):
+    """Put one baked ai_conventions package on sys.path for the whole session.
+
+    The package is imported once; tests hand their own project path to the
+    provider or chdir into it rather than re-importing from every bake.
+    """
+    sys.path.insert(0, str(baked_claude_canary))
+    yield baked_claude_canary
+    sys.path.remove(str(baked_claude_canary))
+    for name in [m for m in sys.modules if m.partition(".")[0] == "ai_conventions"]:
+        del sys.modules[name]
+
+
+@pytest.fixture(scope="session")
+def claude_provider_class(ai_conventions_path):
+    """The ClaudeProvider class from the session's ai_conventions package."""
+    from ai_conventions.providers.claude import ClaudeProvider
+
+    return ClaudeProvider
+
+
+@pytest.fixture(scope="session")
+def capture_command(ai_conventions_path):
+    """The capture click command from the session's ai_conventions package."""
+    from ai_conventions.capture import capture_command
+
+    return capture_command
+
+
+@pytest.fixture
+def copy_project(tmp_path):
+    """Return a function that copies a session-baked project into tmp_path."""
+
+    def copy(project_path: Path) -> Path:
+        return Path(shutil.copytree(project_path, tmp_path / project_path.name))
+
+    return copy
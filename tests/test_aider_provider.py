@@ -1,21 +1,29 @@
 """Test Aider provider integration."""
 
-
-def test_aider_creates_conventions_md_file(cookies):
-    """Test that selecting Aider creates a CONVENTIONS.md file."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
-
+import pytest
+
+AIDER_CONTEXT = {
+    "project_name": "Test AI Conventions",
+    "project_slug": "test-ai-conventions",
+    "author_name": "Test Author",
+    "default_domains": "git,testing",
+    "enable_learning_capture": True,
+    "selected_providers": "aider",
+}
+
+
+@pytest.fixture(scope="module")
+def aider_project(cookies_session):
+    """Bake the default Aider project once for the read-only tests below."""
+    result = cookies_session.bake(extra_context=AIDER_CONTEXT)
     assert result.exit_code == 0
     assert result.exception is None
+    return result
+
+
+def test_aider_creates_conventions_md_file(aider_project):
+    """Test that selecting Aider creates a CONVENTIONS.md file."""
+    result = aider_project
 
     # Check CONVENTIONS.md exists
     conventions_file = result.project_path / "CONVENTIONS.md"
@@ -29,20 +37,9 @@ def test_aider_creates_conventions_md_file(cookies):
     assert "testing" in content.lower()
 
 
-def test_aider_creates_conf_yml_file(cookies):
+def test_aider_creates_conf_yml_file(aider_project):
     """Test that selecting Aider creates .aider.conf.yml file."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
-
-    assert result.exit_code == 0
+    result = aider_project
 
     # Check .aider.conf.yml exists
     conf_file = result.project_path / ".aider.conf.yml"
@@ -55,16 +52,7 @@ def test_aider_creates_conf_yml_file(cookies):
 
 def test_aider_conventions_includes_all_domains(cookies):
     """Test that CONVENTIONS.md includes all selected domains."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing,writing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
+    result = cookies.bake(extra_context={**AIDER_CONTEXT, "default_domains": "git,testing,writing"})
 
     assert result.exit_code == 0
 
@@ -84,20 +72,9 @@ def test_aider_conventions_includes_all_domains(cookies):
     assert "docstrings" in content.lower() or "documentation" in content.lower()
 
 
-def test_aider_conf_yml_includes_extra_read_files(cookies):
+def test_aider_conf_yml_includes_extra_read_files(aider_project):
     """Test that .aider.conf.yml includes domain files when configured."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
-
-    assert result.exit_code == 0
+    result = aider_project
 
     conf_file = result.project_path / ".aider.conf.yml"
     content = conf_file.read_text(encoding="utf-8")
@@ -109,16 +86,7 @@ def test_aider_conf_yml_includes_extra_read_files(cookies):
 
 def test_aider_not_selected_no_files_created(cookies):
     """Test that Aider files are not created when not selected."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "claude",
-        }
-    )
+    result = cookies.bake(extra_context={**AIDER_CONTEXT, "selected_providers": "claude"})
 
     assert result.exit_code == 0
 
@@ -127,20 +95,9 @@ def test_aider_not_selected_no_files_created(cookies):
     assert not (result.project_path / ".aider.conf.yml").exists()
 
 
-def test_aider_setup_documentation_created(cookies):
+def test_aider_setup_documentation_created(aider_project):
     """Test that Aider setup documentation is created."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
-
-    assert result.exit_code == 0
+    result = aider_project
 
     # Check Aider setup docs exist
     aider_docs = result.project_path / "docs" / "aider-setup.md"
@@ -152,44 +109,20 @@ def test_aider_setup_documentation_created(cookies):
     assert "--read" in content
 
 
-def test_aider_learning_capture_integration(cookies):
+def test_aider_learning_capture_integration(aider_project):
     """Test that learning capture is mentioned when enabled."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "aider",
-        }
-    )
-
-    assert result.exit_code == 0
+    result = aider_project
 
     # Check CONVENTIONS.md mentions learning capture
     conventions_file = result.project_path / "CONVENTIONS.md"
     content = conventions_file.read_text(encoding="utf-8")
     assert "staging/learnings.md" in content or "Learning Capture" in content
-
-    # Check .aider.conf.yml might include staging/learnings.md
-    conf_file = result.project_path / ".aider.conf.yml"
-    content = conf_file.read_text(encoding="utf-8")
-    # Could optionally include staging/learnings.md in read list
+    # .aider.conf.yml could optionally include staging/learnings.md in its read list
 
 
 def test_aider_without_learning_capture(cookies):
     """Test Aider configuration when learning capture is disabled."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": False,
-            "selected_providers": "aider",
-        }
-    )
+    result = cookies.bake(extra_context={**AIDER_CONTEXT, "enable_learning_capture": False})
 
     assert result.exit_code == 0
 
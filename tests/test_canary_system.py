@@ -3,30 +3,27 @@
 import re
 import sys
 from datetime import datetime
-from pathlib import Path
 
+import pytest
 
-def test_canary_generation_in_claude_md(cookies):
-    """Test that canary is properly generated in CLAUDE.md."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-            "selected_providers": "claude",
-        }
+
+@pytest.fixture(scope="module")
+def claude_md_template(baked_claude_canary):
+    """The baked CLAUDE.md.j2 template, read once for the template checks."""
+    return (baked_claude_canary / "templates" / "claude" / "CLAUDE.md.j2").read_text(
+        encoding="utf-8"
     )
 
-    assert result.exit_code == 0
 
-    # Add project to path
-    sys.path.insert(0, str(result.project_path))
+def test_canary_generation_in_claude_md(
+    baked_claude_canary, copy_project, claude_provider_class, tmp_path
+):
+    """Test that canary is properly generated in CLAUDE.md."""
+    project_path = copy_project(baked_claude_canary)
 
     # Create necessary files for installation
-    (result.project_path / "domains").mkdir(exist_ok=True)
-    (result.project_path / "global.md").write_text("# Global")
-
-    # Import and run installer
-    from ai_conventions.providers.claude import ClaudeProvider
+    (project_path / "domains").mkdir(exist_ok=True)
+    (project_path / "global.md").write_text("# Global")
 
     config = {
         "enable_context_canary": True,
@@ -35,61 +32,48 @@ def test_canary_generation_in_claude_md(cookies):
         "author_name": "Test Author",
     }
 
-    provider = ClaudeProvider(result.project_path, config)
+    # Run the installer
+    provider = claude_provider_class(project_path, config)
 
     # Create a test installation directory
-    import tempfile
+    test_claude_dir = tmp_path / ".claude"
+    test_claude_dir.mkdir()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_claude_dir = Path(tmpdir) / ".claude"
-        test_claude_dir.mkdir()
+    # Monkey patch the install path
+    provider.get_install_path = lambda path=test_claude_dir: path
 
-        # Monkey patch the install path
-        provider.get_install_path = lambda path=test_claude_dir: path
+    # Install
+    install_result = provider.install()
+    assert install_result.success
 
-        # Install
-        install_result = provider.install()
-        assert install_result.success
-
-        # Check CLAUDE.md was created with canary
-        claude_md = test_claude_dir / "CLAUDE.md"
-        assert claude_md.exists()
+    # Check CLAUDE.md was created with canary
+    claude_md = test_claude_dir / "CLAUDE.md"
+    assert claude_md.exists()
 
-        content = claude_md.read_text(encoding="utf-8")
+    content = claude_md.read_text(encoding="utf-8")
 
-        # Check for canary section
-        assert "## 🦜 Context Health Check" in content
-        assert "CANARY_PHRASE: 🦜-CONVENTIONS-ACTIVE-" in content
+    # Check for canary section
+    assert "## 🦜 Context Health Check" in content
+    assert "CANARY_PHRASE: 🦜-CONVENTIONS-ACTIVE-" in content
 
-        # Extract timestamp
-        match = re.search(r"🦜-CONVENTIONS-ACTIVE-(\d{8}-\d{6})", content)
-        assert match is not None
+    # Extract timestamp
+    match = re.search(r"🦜-CONVENTIONS-ACTIVE-(\d{8}-\d{6})", content)
+    assert match is not None
 
-        timestamp = match.group(1)
-        # Verify timestamp format
-        assert re.match(r"\d{8}-\d{6}", timestamp)
+    timestamp = match.group(1)
+    # Verify timestamp format
+    assert re.match(r"\d{8}-\d{6}", timestamp)
 
 
-def test_canary_uniqueness_per_install(cookies):
+def test_canary_uniqueness_per_install(
+    baked_claude_canary, copy_project, claude_provider_class, tmp_path, monkeypatch
+):
     """Test that each install gets a unique canary timestamp."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-            "selected_providers": "claude",
-        }
-    )
-
-    assert result.exit_code == 0
-
-    # Add project to path
-    sys.path.insert(0, str(result.project_path))
+    project_path = copy_project(baked_claude_canary)
 
     # Create necessary files
-    (result.project_path / "domains").mkdir(exist_ok=True)
-    (result.project_path / "global.md").write_text("# Global")
-
-    from ai_conventions.providers.claude import ClaudeProvider
+    (project_path / "domains").mkdir(exist_ok=True)
+    (project_path / "global.md").write_text("# Global")
 
     config = {
         "enable_context_canary": True,
@@ -100,39 +84,42 @@ def test_canary_uniqueness_per_install(cookies):
 
     timestamps = []
 
-    # Do two installations with a small delay
-    import tempfile
-    import time
+    # Give each install its own clock reading instead of sleeping between them
+    install_times = iter([datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 1, 1, 0, 0, 1)])
 
-    for i in range(2):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            provider = ClaudeProvider(result.project_path, config)
-            test_claude_dir = Path(tmpdir) / ".claude"
-            test_claude_dir.mkdir()
+    class InstallClock:
+        @staticmethod
+        def now():
+            return next(install_times)
 
-            provider.get_install_path = lambda path=test_claude_dir: path
+    monkeypatch.setattr(sys.modules[claude_provider_class.__module__], "datetime", InstallClock)
 
-            # Install
-            provider.install()
+    # One provider serves both installs; only the target directory changes
+    provider = claude_provider_class(project_path, config)
 
-            # Extract timestamp from CLAUDE.md
-            claude_md = test_claude_dir / "CLAUDE.md"
-            content = claude_md.read_text(encoding="utf-8")
+    for i in range(2):
+        test_claude_dir = tmp_path / f"install{i}" / ".claude"
+        test_claude_dir.mkdir(parents=True)
+
+        provider.get_install_path = lambda path=test_claude_dir: path
+
+        # Install
+        provider.install()
 
-            match = re.search(r"🦜-CONVENTIONS-ACTIVE-(\d{8}-\d{6})", content)
-            assert match is not None
+        # Extract timestamp from CLAUDE.md
+        claude_md = test_claude_dir / "CLAUDE.md"
+        content = claude_md.read_text(encoding="utf-8")
 
-            timestamps.append(match.group(1))
+        match = re.search(r"🦜-CONVENTIONS-ACTIVE-(\d{8}-\d{6})", content)
+        assert match is not None
 
-            # Small delay to ensure different timestamps
-            if i == 0:
-                time.sleep(1)
+        timestamps.append(match.group(1))
 
     # Timestamps should be unique
     assert timestamps[0] != timestamps[1]
 
 
-def test_canary_disabled_when_setting_false(cookies):
+def test_canary_disabled_when_setting_false(cookies, claude_provider_class, tmp_path):
     """Test that canary is not included when disabled."""
     result = cookies.bake(
         extra_context={
@@ -144,15 +131,10 @@ def test_canary_disabled_when_setting_false(cookies):
 
     assert result.exit_code == 0
 
-    # Add project to path
-    sys.path.insert(0, str(result.project_path))
-
     # Create necessary files
     (result.project_path / "domains").mkdir(exist_ok=True)
     (result.project_path / "global.md").write_text("# Global")
 
-    from ai_conventions.providers.claude import ClaudeProvider
-
     config = {
         "enable_context_canary": False,
         "project_name": "Test Project",
@@ -160,85 +142,43 @@ def test_canary_disabled_when_setting_false(cookies):
         "author_name": "Test Author",
     }
 
-    provider = ClaudeProvider(result.project_path, config)
+    provider = claude_provider_class(result.project_path, config)
 
-    import tempfile
+    test_claude_dir = tmp_path / ".claude"
+    test_claude_dir.mkdir()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_claude_dir = Path(tmpdir) / ".claude"
-        test_claude_dir.mkdir()
+    provider.get_install_path = lambda: test_claude_dir
 
-        provider.get_install_path = lambda: test_claude_dir
+    # Install
+    provider.install()
 
-        # Install
-        provider.install()
+    # Check CLAUDE.md
+    claude_md = test_claude_dir / "CLAUDE.md"
+    assert claude_md.exists()
 
-        # Check CLAUDE.md
-        claude_md = test_claude_dir / "CLAUDE.md"
-        assert claude_md.exists()
+    content = claude_md.read_text(encoding="utf-8")
 
-        content = claude_md.read_text(encoding="utf-8")
+    # Should NOT have canary section
+    assert "## 🦜 Context Health Check" not in content
+    assert "CANARY_PHRASE" not in content
 
-        # Should NOT have canary section
-        assert "## 🦜 Context Health Check" not in content
-        assert "CANARY_PHRASE" not in content
 
-
-def test_canary_trigger_phrases_in_template(cookies):
+def test_canary_trigger_phrases_in_template(claude_md_template):
     """Test that canary template includes trigger phrases."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-        }
-    )
-
-    assert result.exit_code == 0
-
-    # Check the CLAUDE.md template
-    template_path = result.project_path / "templates" / "claude" / "CLAUDE.md.j2"
-    assert template_path.exists()
-
-    content = template_path.read_text(encoding="utf-8")
+    phrases = {"check conventions", "convention check", "canary", "conventions loaded?"}
+    missing = {phrase for phrase in phrases if phrase not in claude_md_template}
+    assert not missing, missing
 
-    # Check for trigger phrases
-    assert "check conventions" in content
-    assert "convention check" in content
-    assert "canary" in content
-    assert "conventions loaded?" in content
 
-
-def test_canary_response_format_documented(cookies):
+def test_canary_response_format_documented(claude_md_template):
     """Test that canary response format is documented."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-        }
-    )
-
-    assert result.exit_code == 0
-
-    # Check the template
-    template_path = result.project_path / "templates" / "claude" / "CLAUDE.md.j2"
-    content = template_path.read_text(encoding="utf-8")
-
-    # Check for response format
-    assert "✓ Conventions loaded!" in content
-    assert "Canary: 🦜-CONVENTIONS-ACTIVE-" in content
+    needles = {"✓ Conventions loaded!", "Canary: 🦜-CONVENTIONS-ACTIVE-"}
+    missing = {needle for needle in needles if needle not in claude_md_template}
+    assert not missing, missing
 
 
-def test_canary_timestamp_format(cookies):
+def test_canary_timestamp_format():
     """Test that canary timestamp follows expected format."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-        }
-    )
-
-    assert result.exit_code == 0
-
     # Test timestamp format
     now = datetime.now()
     timestamp = now.strftime("%Y%m%d-%H%M%S")
@@ -250,19 +190,12 @@ def test_canary_timestamp_format(cookies):
     assert timestamp[9:].isdigit()
 
 
-def test_canary_in_install_py_config(cookies):
+def test_canary_in_install_py_config(baked_claude_canary):
     """Test that install.py loads canary configuration."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_context_canary": True,
-        }
-    )
-
-    assert result.exit_code == 0
+    project_path = baked_claude_canary
 
     # Check install.py
-    install_py = result.project_path / "install.py"
+    install_py = project_path / "install.py"
     content = install_py.read_text(encoding="utf-8")
 
     # Should have enable_context_canary in config
@@ -1,248 +1,171 @@
 """Test capture command functionality."""
 
-import os
-import sys
-
 import yaml
 from click.testing import CliRunner
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-def test_capture_defaults_to_core_md(cookies):
-    """Test that capture defaults to core.md when no --file specified."""
-    bake_result = cookies.bake(
-        extra_context={
-            "project_slug": "test-capture",
-            "enable_learning_capture": True,
-        }
-    )
+# CliRunner isolates each invoke, so one instance serves every test
+runner = CliRunner()
 
-    assert bake_result.exit_code == 0
 
-    # Add the project to Python path
-    sys.path.insert(0, str(bake_result.project_path))
+def test_capture_defaults_to_core_md(
+    baked_capture_project, copy_project, capture_command, monkeypatch
+):
+    """Test that capture defaults to core.md when no --file specified."""
+    project_path = copy_project(baked_capture_project)
 
     # Create domains directory
-    domains_dir = bake_result.project_path / "domains"
+    domains_dir = project_path / "domains"
     domains_dir.mkdir(exist_ok=True)
 
     # Change to project directory for the command
-    original_cwd = os.getcwd()
-    os.chdir(bake_result.project_path)
-
-    try:
-        from ai_conventions.capture import capture_command
-
-        runner = CliRunner()
-        cli_result = runner.invoke(capture_command, ["Always use type hints", "--domain", "python"])
+    monkeypatch.chdir(project_path)
 
-        assert cli_result.exit_code == 0
+    cli_result = runner.invoke(capture_command, ["Always use type hints", "--domain", "python"])
 
-        # Check that it went to core.md
-        core_file = domains_dir / "python" / "core.md"
-        assert core_file.exists()
+    assert cli_result.exit_code == 0
 
-        content = core_file.read_text()
-        assert "Always use type hints" in content
-        assert "pattern" in content  # default category
+    # Check that it went to core.md
+    core_file = domains_dir / "python" / "core.md"
+    assert core_file.exists()
 
-    finally:
-        os.chdir(original_cwd)
-        if str(bake_result.project_path) in sys.path:
-            sys.path.remove(str(bake_result.project_path))
+    content = core_file.read_text()
+    assert "Always use type hints" in content
+    assert "pattern" in content  # default category
 
 
-def test_capture_with_specific_file(cookies):
+def test_capture_with_specific_file(
+    baked_capture_project, copy_project, capture_command, monkeypatch
+):
     """Test capture with --file option."""
-    bake_result = cookies.bake(
-        extra_context={
-            "project_slug": "test-capture",
-            "enable_learning_capture": True,
-        }
-    )
-
-    assert bake_result.exit_code == 0
+    project_path = copy_project(baked_capture_project)
 
-    sys.path.insert(0, str(bake_result.project_path))
-    domains_dir = bake_result.project_path / "domains"
+    domains_dir = project_path / "domains"
     domains_dir.mkdir(exist_ok=True)
 
-    original_cwd = os.getcwd()
-    os.chdir(bake_result.project_path)
+    monkeypatch.chdir(project_path)
 
-    try:
-        from ai_conventions.capture import capture_command
+    cli_result = runner.invoke(
+        capture_command,
+        ["Use semantic commit messages", "--domain", "git", "--file", "commits"],
+    )
 
-        runner = CliRunner()
-        cli_result = runner.invoke(
-            capture_command,
-            ["Use semantic commit messages", "--domain", "git", "--file", "commits"],
-        )
+    assert cli_result.exit_code == 0
 
-        assert cli_result.exit_code == 0
+    # Check that it went to commits.md
+    commits_file = domains_dir / "git" / "commits.md"
+    assert commits_file.exists()
 
-        # Check that it went to commits.md
-        commits_file = domains_dir / "git" / "commits.md"
-        assert commits_file.exists()
+    content = commits_file.read_text()
+    assert "Use semantic commit messages" in content
 
-        content = commits_file.read_text()
-        assert "Use semantic commit messages" in content
 
-    finally:
-        os.chdir(original_cwd)
-        if str(bake_result.project_path) in sys.path:
-            sys.path.remove(str(bake_result.project_path))
+def test_capture_with_nested_file_path(
+    baked_capture_project, copy_project, capture_command, monkeypatch
+):
+    """Test capture with nested file path like pr-summaries/guidelines."""
+    project_path = copy_project(baked_capture_project)
 
+    domains_dir = project_path / "domains"
+    domains_dir.mkdir(exist_ok=True)
 
-def test_capture_with_nested_file_path(cookies):
-    """Test capture with nested file path like pr-summaries/guidelines."""
-    bake_result = cookies.bake(
-        extra_context={
-            "project_slug": "test-capture",
-            "enable_learning_capture": True,
-        }
+    monkeypatch.chdir(project_path)
+
+    cli_result = runner.invoke(
+        capture_command,
+        ["Keep PRs focused and small", "--domain", "git", "--file", "pr-summaries/guidelines"],
     )
 
-    assert bake_result.exit_code == 0
+    assert cli_result.exit_code == 0
 
-    sys.path.insert(0, str(bake_result.project_path))
-    domains_dir = bake_result.project_path / "domains"
-    domains_dir.mkdir(exist_ok=True)
+    # Check that nested directory was created
+    nested_file = domains_dir / "git" / "pr-summaries" / "guidelines.md"
+    assert nested_file.exists()
 
-    original_cwd = os.getcwd()
-    os.chdir(bake_result.project_path)
+    content = nested_file.read_text()
+    assert "Keep PRs focused and small" in content
 
-    try:
-        from ai_conventions.capture import capture_command
+    # Check that parent directories were created
+    assert (domains_dir / "git" / "pr-summaries").exists()
 
-        runner = CliRunner()
-        cli_result = runner.invoke(
-            capture_command,
-            ["Keep PRs focused and small", "--domain", "git", "--file", "pr-summaries/guidelines"],
-        )
 
-        assert cli_result.exit_code == 0
+def test_capture_creates_central_log(
+    baked_capture_project, copy_project, capture_command, monkeypatch
+):
+    """Test that captures are logged to central .ai-conventions-log.yaml."""
+    project_path = copy_project(baked_capture_project)
 
-        # Check that nested directory was created
-        nested_file = domains_dir / "git" / "pr-summaries" / "guidelines.md"
-        assert nested_file.exists()
+    domains_dir = project_path / "domains"
+    domains_dir.mkdir(exist_ok=True)
 
-        content = nested_file.read_text()
-        assert "Keep PRs focused and small" in content
+    monkeypatch.chdir(project_path)
+
+    cli_result = runner.invoke(
+        capture_command,
+        [
+            "Test logging functionality",
+            "--domain",
+            "testing",
+            "--file",
+            "strategies",
+            "--category",
+            "pattern",
+        ],
+    )
 
-        # Check that parent directories were created
-        assert (domains_dir / "git" / "pr-summaries").exists()
+    assert cli_result.exit_code == 0
 
-    finally:
-        os.chdir(original_cwd)
-        if str(bake_result.project_path) in sys.path:
-            sys.path.remove(str(bake_result.project_path))
+    # Check that central log was created
+    log_file = project_path / ".ai-conventions-log.yaml"
+    assert log_file.exists()
 
+    # Check log content
+    with open(log_file) as f:
+        logs = yaml.load(f, Loader=SafeLoader)
 
-def test_capture_creates_central_log(cookies):
-    """Test that captures are logged to central .ai-conventions-log.yaml."""
-    bake_result = cookies.bake(
-        extra_context={
-            "project_slug": "test-capture",
-            "enable_learning_capture": True,
-        }
-    )
+    assert len(logs) == 1
+    log_entry = logs[0]
 
-    assert bake_result.exit_code == 0
+    assert log_entry["domain"] == "testing"
+    assert log_entry["file"] == "strategies.md"
+    assert log_entry["category"] == "pattern"
+    assert log_entry["pattern"] == "Test logging functionality"
+    assert "domains/testing/strategies.md" in log_entry["target_file"]
+    assert "timestamp" in log_entry
 
-    sys.path.insert(0, str(bake_result.project_path))
-    domains_dir = bake_result.project_path / "domains"
-    domains_dir.mkdir(exist_ok=True)
 
-    original_cwd = os.getcwd()
-    os.chdir(bake_result.project_path)
-
-    try:
-        from ai_conventions.capture import capture_command
-
-        runner = CliRunner()
-        cli_result = runner.invoke(
-            capture_command,
-            [
-                "Test logging functionality",
-                "--domain",
-                "testing",
-                "--file",
-                "strategies",
-                "--category",
-                "pattern",
-            ],
-        )
-
-        assert cli_result.exit_code == 0
-
-        # Check that central log was created
-        log_file = bake_result.project_path / ".ai-conventions-log.yaml"
-        assert log_file.exists()
-
-        # Check log content
-        with open(log_file) as f:
-            logs = yaml.safe_load(f)
-
-        assert len(logs) == 1
-        log_entry = logs[0]
-
-        assert log_entry["domain"] == "testing"
-        assert log_entry["file"] == "strategies.md"
-        assert log_entry["category"] == "pattern"
-        assert log_entry["pattern"] == "Test logging functionality"
-        assert "domains/testing/strategies.md" in log_entry["target_file"]
-        assert "timestamp" in log_entry
-
-    finally:
-        os.chdir(original_cwd)
-        if str(bake_result.project_path) in sys.path:
-            sys.path.remove(str(bake_result.project_path))
-
-
-def test_capture_auto_adds_md_extension(cookies):
+def test_capture_auto_adds_md_extension(
+    baked_capture_project, copy_project, capture_command, monkeypatch
+):
     """Test that .md extension is automatically added to file names."""
-    bake_result = cookies.bake(
-        extra_context={
-            "project_slug": "test-capture",
-            "enable_learning_capture": True,
-        }
+    project_path = copy_project(baked_capture_project)
+
+    domains_dir = project_path / "domains"
+    domains_dir.mkdir(exist_ok=True)
+
+    monkeypatch.chdir(project_path)
+
+    cli_result = runner.invoke(
+        capture_command,
+        [
+            "Test auto extension",
+            "--domain",
+            "git",
+            "--file",
+            "workflows",  # No .md extension
+        ],
     )
 
-    assert bake_result.exit_code == 0
+    assert cli_result.exit_code == 0
 
-    sys.path.insert(0, str(bake_result.project_path))
-    domains_dir = bake_result.project_path / "domains"
-    domains_dir.mkdir(exist_ok=True)
+    # Check that .md was automatically added
+    workflows_file = domains_dir / "git" / "workflows.md"
+    assert workflows_file.exists()
 
-    original_cwd = os.getcwd()
-    os.chdir(bake_result.project_path)
-
-    try:
-        from ai_conventions.capture import capture_command
-
-        runner = CliRunner()
-        cli_result = runner.invoke(
-            capture_command,
-            [
-                "Test auto extension",
-                "--domain",
-                "git",
-                "--file",
-                "workflows",  # No .md extension
-            ],
-        )
-
-        assert cli_result.exit_code == 0
-
-        # Check that .md was automatically added
-        workflows_file = domains_dir / "git" / "workflows.md"
-        assert workflows_file.exists()
-
-        # Should not create a file without extension
-        workflows_file_no_ext = domains_dir / "git" / "workflows"
-        assert not workflows_file_no_ext.exists()
-
-    finally:
-        os.chdir(original_cwd)
-        if str(bake_result.project_path) in sys.path:
-            sys.path.remove(str(bake_result.project_path))
+    # Should not create a file without extension
+    workflows_file_no_ext = domains_dir / "git" / "workflows"
+    assert not workflows_file_no_ext.exists()
@@ -1,61 +1,55 @@
 """Test Claude provider integration."""
 
+import pytest
 
-def test_claude_commands_included_when_provider_selected(cookies):
-    """Test that Claude commands are included when Claude provider is selected."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "claude",
-        }
-    )
-
-    assert result.exit_code == 0
-    assert result.exception is None
 
-    # Check Claude commands exist
-    claude_commands_dir = result.project_path / ".claude" / "commands"
-    assert claude_commands_dir.exists()
-    assert (claude_commands_dir / "capture-learning.md").exists()
-    assert (claude_commands_dir / "review-learnings.md").exists()
+@pytest.fixture(scope="module")
+def claude_matrix_project(request, cookies_session, baked_claude_project):
+    """Project baked once per (selected_providers, enable_learning_capture) pair."""
+    providers, learning = request.param
+    if (providers, learning) == ("claude", True):
+        # Same context as the shared session bake
+        return baked_claude_project
 
-    # Check Python commands are removed but directory still exists with .md files
-    commands_dir = result.project_path / "commands"
-    assert commands_dir.exists()
-    # Python scripts should be removed
-    assert not (commands_dir / "capture-learning.py").exists()
-    assert not (commands_dir / "review-learnings.py").exists()
-    # But .md files should remain
-    assert (commands_dir / "capture-learning.md").exists()
-    assert (commands_dir / "review-learnings.md").exists()
-
-
-def test_claude_commands_removed_when_provider_not_selected(cookies):
-    """Test that Claude commands are removed when Claude is not selected."""
-    result = cookies.bake(
+    result = cookies_session.bake(
         extra_context={
             "project_name": "Test AI Conventions",
             "project_slug": "test-ai-conventions",
             "author_name": "Test Author",
             "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "cursor",
+            "enable_learning_capture": learning,
+            "selected_providers": providers,
         }
     )
 
     assert result.exit_code == 0
     assert result.exception is None
-
-    # Check Claude commands don't exist
-    claude_dir = result.project_path / ".claude"
-    assert not claude_dir.exists()
+    return result.project_path
+
+
+@pytest.mark.parametrize(
+    "claude_matrix_project, expect_claude",
+    [
+        pytest.param(("claude", True), True, id="claude-selected"),
+        pytest.param(("cursor", True), False, id="claude-not-selected"),
+        # Learning capture stays available even when disabled (improved UX)
+        pytest.param(("claude", False), True, id="learning-disabled"),
+    ],
+    indirect=["claude_matrix_project"],
+)
+def test_claude_commands_matrix(claude_matrix_project, expect_claude):
+    """Test Claude commands follow provider selection and commands are always available."""
+    project_path = claude_matrix_project
+
+    # Claude commands exist only when Claude is selected
+    claude_dir = project_path / ".claude"
+    assert claude_dir.exists() == expect_claude
+    if expect_claude:
+        assert (claude_dir / "commands" / "capture-learning.md").exists()
+        assert (claude_dir / "commands" / "review-learnings.md").exists()
 
     # Check commands directory exists with .md files but no .py files
-    commands_dir = result.project_path / "commands"
+    commands_dir = project_path / "commands"
     assert commands_dir.exists()
     # Python scripts should be removed
     assert not (commands_dir / "capture-learning.py").exists()
@@ -65,50 +59,11 @@ def test_claude_commands_removed_when_provider_not_selected(cookies):
     assert (commands_dir / "review-learnings.md").exists()
 
 
-def test_claude_learning_capture_always_available(cookies):
-    """Test that Claude learning capture is always available (improved UX)."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": False,  # Even when disabled, should be available
-            "selected_providers": "claude",
-        }
-    )
-
-    assert result.exit_code == 0
-    assert result.exception is None
-
-    # Learning capture should always be available for better UX
-    claude_dir = result.project_path / ".claude"
-    commands_dir = result.project_path / "commands"
-    assert claude_dir.exists()  # Claude config should exist since we selected Claude
-    assert commands_dir.exists()  # Commands should always be available
-
-    # Check specific learning capture files exist
-    assert (claude_dir / "commands" / "capture-learning.md").exists()
-    assert (commands_dir / "capture-learning.md").exists()
-
-
-def test_claude_setup_docs_created(cookies):
+def test_claude_setup_docs_created(baked_claude_project):
     """Test that Claude setup documentation is created."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "selected_providers": "claude",
-        }
-    )
-
-    assert result.exit_code == 0
-    assert result.exception is None
+    project_path = baked_claude_project
 
     # Check Claude setup docs exist
-    claude_setup = result.project_path / "docs" / "claude-setup.md"
+    claude_setup = project_path / "docs" / "claude-setup.md"
     assert claude_setup.exists()
     assert "Claude Code Setup Guide" in claude_setup.read_text(encoding="utf-8")
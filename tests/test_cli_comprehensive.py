@@ -30,16 +30,12 @@ class TestCLIComprehensive(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment once for all tests."""
-        # Create a test project
-        import shutil
+        # Create a test project in a fresh temporary directory
+        import tempfile
 
         from cookiecutter.main import cookiecutter
 
-        cls.test_dir = Path(__file__).parent.parent / "test-output-cli"
-        # Clean up any existing test directory
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
-        cls.test_dir.mkdir(exist_ok=True)
+        cls.test_dir = Path(tempfile.mkdtemp(prefix="test-output-cli-"))
 
         cls.project_dir = cookiecutter(
             str(Path(__file__).parent.parent),
@@ -68,8 +64,7 @@ class TestCLIComprehensive(unittest.TestCase):
         # Clean up test directory
         import shutil
 
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
 
     def test_all_main_cli_commands(self):
         """Test all main CLI commands using table-driven approach."""
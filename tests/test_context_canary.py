@@ -31,26 +31,6 @@ def test_canary_enabled_in_claude_md(cookies):
     assert "enable_context_canary" in str(result.context)
 
 
-def test_canary_disabled_when_setting_false(cookies):
-    """Test that canary is not included when disabled."""
-    result = cookies.bake(
-        extra_context={
-            "project_name": "Test AI Conventions",
-            "project_slug": "test-ai-conventions",
-            "author_name": "Test Author",
-            "default_domains": "git,testing",
-            "enable_learning_capture": True,
-            "enable_context_canary": False,
-            "selected_providers": "claude",
-        }
-    )
-
-    assert result.exit_code == 0
-
-    # Verify the setting is respected
-    # In real implementation, would check generated CLAUDE.md has no canary
-
-
 def test_canary_configuration_in_cookiecutter_json():
     """Test that cookiecutter.json has canary configuration option."""
     cookiecutter_json = Path("cookiecutter.json")
@@ -149,27 +149,6 @@ Combines testing and API domains.
     assert "- api" in content
 
 
-def test_domain_resolver_module_created(cookies):
-    """Test that domain resolver module is created when composition is enabled."""
-    result = cookies.bake(
-        extra_context={
-            "project_slug": "my-project",
-            "enable_domain_composition": True,
-        }
-    )
-
-    assert result.exit_code == 0
-
-    # Check domain resolver exists
-    resolver = result.project_path / "ai_conventions" / "domain_resolver.py"
-    assert resolver.exists()
-
-    # Check it has the necessary functions
-    content = resolver.read_text(encoding="utf-8")
-    assert "def resolve_domain" in content or "def load_domain" in content
-    assert "class" in content  # Should have a resolver class
-
-
 def test_cookiecutter_json_has_composition_option(cookies):
     """Test that cookiecutter.json includes domain composition option."""
     cookiecutter_json = Path("cookiecutter.json")
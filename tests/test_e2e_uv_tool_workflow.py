@@ -391,7 +391,7 @@ class TestE2EUVToolWorkflow:
         3. Virtual environment handling incorrect
         """
         # Arrange: Clean up any existing test tools first
-        test_prefixes = ["test-", "isolation-", "my-ai-", "ai-conventions"]
+        test_prefixes = ("test-", "isolation-", "my-ai-", "ai-conventions")
 
         existing_tools = subprocess.run(
             ["uv", "tool", "list"],
@@ -404,14 +404,12 @@ class TestE2EUVToolWorkflow:
         for line in existing_tools.stdout.split("\n"):
             if line.strip() and not line.startswith(" "):
                 tool_name = line.split()[0]
-                for prefix in test_prefixes:
-                    if tool_name.startswith(prefix):
-                        subprocess.run(
-                            ["uv", "tool", "uninstall", tool_name],
-                            capture_output=True,
-                            check=False,
-                        )
-                        break
+                if tool_name.startswith(test_prefixes):
+                    subprocess.run(
+                        ["uv", "tool", "uninstall", tool_name],
+                        capture_output=True,
+                        check=False,
+                    )
 
         # Check clean initial state
         initial_tools = subprocess.run(
@@ -426,7 +424,7 @@ class TestE2EUVToolWorkflow:
             [
                 line
                 for line in initial_tools.stdout.split("\n")
-                if line.strip() and not line.startswith(" ") and not line.startswith("-")
+                if line.strip() and not line.startswith((" ", "-"))
             ]
         )
 
@@ -469,7 +467,7 @@ class TestE2EUVToolWorkflow:
                 [
                     line
                     for line in after_install_tools.stdout.split("\n")
-                    if line.strip() and not line.startswith(" ") and not line.startswith("-")
+                    if line.strip() and not line.startswith((" ", "-"))
                 ]
             )
 
@@ -503,7 +501,7 @@ class TestE2EUVToolWorkflow:
                 [
                     line
                     for line in final_tools.stdout.split("\n")
-                    if line.strip() and not line.startswith(" ") and not line.startswith("-")
+                    if line.strip() and not line.startswith((" ", "-"))
                 ]
             )
 
@@ -3,7 +3,6 @@
 These tests verify hook behavior without full cookiecutter execution.
 """
 
-import json
 import shutil
 import sys
 from pathlib import Path
@@ -15,47 +14,32 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "hooks"))
 class TestPostGenProjectHook:
     """Test post-generation hook functions."""
 
-    def test_copy_domains_from_selection_file(self, tmp_path):
-        """Test that domains are copied based on selection file."""
+    def test_copy_domains_from_selection(self, tmp_path):
+        """Test that only the selected domains are moved into domains/."""
+        from post_gen_project import copy_domain
+
         # Arrange: Set up source domains
-        source_domains = tmp_path / "source" / "community-domains"
-        source_domains.mkdir(parents=True)
+        source_domains = tmp_path / "community-domains"
+        source_domains.mkdir()
 
         for domain in ["git", "testing", "writing"]:
             domain_dir = source_domains / domain
             domain_dir.mkdir()
             (domain_dir / "core.md").write_text(f"# {domain} core content")
 
-        # Arrange: Create selection file
-        import tempfile
-
-        temp_file = Path(tempfile.gettempdir()) / "cookiecutter_selected_domains.json"
-        temp_file.write_text(json.dumps({"selected_domains": ["git", "testing"]}))
-
         # Arrange: Set up destination
-        dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-        domains_dir = dest_dir / "domains"
+        domains_dir = tmp_path / "domains"
         domains_dir.mkdir()
 
-        # Act: Simulate domain copying logic
-        with open(temp_file) as f:
-            context = json.load(f)
-
-        for domain_name in context.get("selected_domains", []):
-            source_path = source_domains / domain_name
-            dest_path = domains_dir / domain_name
-            if source_path.exists():
-                shutil.copytree(source_path, dest_path)
+        # Act: Selection is handed over in-process, as the hook receives it
+        for domain_name in ["git", "testing"]:
+            copy_domain(domain_name, source_domains, domains_dir)
 
         # Assert: Selected domains were copied
-        assert (domains_dir / "git").exists()
+        assert (domains_dir / "git" / "core.md").read_text() == "# git core content"
         assert (domains_dir / "testing").exists()
         assert not (domains_dir / "writing").exists()
 
-        # Clean up
-        temp_file.unlink()
-
     def test_remove_learning_directories_when_disabled(self, tmp_path):
         """Test that learning directories are removed when disabled."""
         # Arrange: Create directories
@@ -126,3 +110,50 @@ class TestPostGenProjectHook:
         content = providers_file.read_text(encoding="utf-8")
         assert "claude" in content
         assert "cursor" in content
+
+    def test_render_config_yaml_round_trips(self):
+        """Test that the hand-rolled config emitter produces loadable YAML."""
+        import yaml
+        from post_gen_project import render_config_yaml
+
+        config = {
+            "project_name": 'My "Quoted" Project: v2',
+            "author_name": "Café 😀 x: y",
+            "author_email": None,
+            "selected_providers": ["claude", "cursor"],
+            "default_domains": "",
+            "enable_learning_capture": True,
+            "enable_context_canary": False,
+            "no_providers": [],
+        }
+
+        assert yaml.safe_load(render_config_yaml(config)) == config
+
+    def test_parse_list_option_accepts_strings_and_lists(self):
+        """Test that jsonify-rendered options decode to clean name lists."""
+        from post_gen_project import parse_list_option
+
+        assert parse_list_option('"claude, cursor"') == ["claude", "cursor"]
+        assert parse_list_option('["git", "testing"]') == ["git", "testing"]
+        assert parse_list_option('"[\\"git\\"]"') == ["git"]
+        assert parse_list_option('""') == []
+        assert parse_list_option('"[git, testing]"') == ["git", "testing"]
+        assert parse_list_option("\"['claude']\"") == ["claude"]
+        assert parse_list_option('["git", null, 1]') == ["git"]
+
+    def test_update_readme_handles_crlf_and_missing_blank_line(self, tmp_path, monkeypatch):
+        """Test that the included section follows the title for CRLF and tight READMEs."""
+        from post_gen_project import update_readme
+
+        monkeypatch.chdir(tmp_path)
+        readme = tmp_path / "README.md"
+
+        readme.write_bytes(b"# Title\r\n\r\nIntro\r\n")
+        update_readme(["claude"], ["git"], False)
+        content = readme.read_bytes()
+        assert content.startswith(b"# Title\r\n\r\n## \xf0\x9f\x93\xa6 What's Included\r\n")
+        assert b"\n" not in content.replace(b"\r\n", b"")
+
+        readme.write_bytes(b"# Title\nIntro\n\n```bash\n# comment\n\nls\n```\n")
+        update_readme(["claude"], [], False)
+        assert readme.read_text(encoding="utf-8").startswith("# Title\n## 📦 What's Included\n")
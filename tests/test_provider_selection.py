@@ -80,6 +80,22 @@ def test_provider_selection_with_spaces(cookies):
     assert (providers_dir / "windsurf.py").exists()
 
 
+def test_provider_selection_as_list(cookies):
+    """Test that a provider list passed via extra_context is parsed."""
+    result = cookies.bake(
+        extra_context={
+            "project_slug": "test-list",
+            "selected_providers": ["claude", "cursor"],
+        }
+    )
+
+    assert result.exit_code == 0
+
+    assert (result.project_path / ".claude").exists()
+    assert (result.project_path / ".cursorrules").exists()
+    assert not (result.project_path / ".windsurfrules").exists()
+
+
 def test_all_providers_selection(cookies):
     """Test selecting all providers."""
     result = cookies.bake(
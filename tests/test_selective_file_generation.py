@@ -333,8 +333,9 @@ class TestSelectiveFileGeneration:
         generated_project = Path(project_dir)
         readme_content = (generated_project / "README.md").read_text()
 
-        # Check for included components section
+        # Check for included components section, placed right under the title
         assert "## 📦 What's Included" in readme_content
+        assert readme_content.split("\n")[2] == "## 📦 What's Included"
         assert "### AI Providers" in readme_content
         assert "- Claude" in readme_content
         assert "- Cursor" in readme_content